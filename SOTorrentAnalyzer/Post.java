@@ -2,25 +2,22 @@ import java.util.*;
 public class Post {
     private int postId;
     private LinkedList<PostHistory> postHistories;
+    private HashMap<Integer, PostHistory> postHistoryIndex;
 
     public Post (int postId) {
         this.postId = postId;
         postHistories = new LinkedList<PostHistory>();
+        postHistoryIndex = new HashMap<Integer, PostHistory>();
     }
 
     public void addPostHistory(PostHistory postHistory){
         postHistories.add(postHistory);
+        postHistoryIndex.putIfAbsent(postHistory.getPostHistoryId(), postHistory);
     }
 
     public PostHistory getPostHistory(int postHistoryId){
-        for(int i = 0; i < postHistories.size(); i++){
-            if(postHistories.get(i).getPostHistoryId() == postHistoryId){
-                // System.out.println("Found the posthistory!");
-                return postHistories.get(i);
-            }
-        }
-        // System.out.println("Will return null - from Post");
-        return null;
+        // returns null when the post has no such posthistory
+        return postHistoryIndex.get(postHistoryId);
     }
 
     public LinkedList<PostHistory> getPostHistories() {
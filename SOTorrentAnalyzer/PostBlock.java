@@ -1,6 +1,6 @@
 import java.util.*;
 public class PostBlock {
-    private int postBlockId;
+    private final int postBlockId;
     private boolean isCodeBlock;
     private int localId;
     private int precedingPostHistoryId;
@@ -28,10 +28,6 @@ public class PostBlock {
         return postBlockId;
     }
 
-    public void setPostBlockId(int postBlockId) {
-        this.postBlockId = postBlockId;
-    }
-
     public boolean isCodeBlock() {
         return isCodeBlock;
     }
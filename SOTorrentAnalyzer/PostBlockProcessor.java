@@ -19,10 +19,10 @@ public class PostBlockProcessor {
         try {
             //Connect the program with MySQL DB
             System.out.println("The program has been initiated.");
-            FileReader fileReader = new FileReader(answerFilePath);
-            BufferedReader bufferedReader = new BufferedReader(fileReader);
+            // read the answer ids once and take the query count from them
             Path path = Paths.get(answerFilePath);
-            long countLine = Files.lines(path).count();
+            List<String> postIds = Files.readAllLines(path);
+            long countLine = postIds.size();
             String dbUrl = "jdbc:mysql://localhost:3306/sotorrent?autoReconnect=true&useSSL=false";
             String username = "sotorrent";
             String password = "stackoverflow";
@@ -36,58 +36,56 @@ public class PostBlockProcessor {
             }
             Connection connection = DriverManager.getConnection(dbUrl, username, password);
             Statement statement = connection.createStatement();
-            Statement statement2 = connection.createStatement();
             System.out.println("Connected to the database successfully!\nBeginning querying process..." +
                     "\nThe number of queries initiated: " + countLine);
 
             // Processing Post by creating Post objects
             long count = 0;
-            String s;
             ArrayList<Post> posts = new ArrayList<Post>();
-            while ((s = bufferedReader.readLine()) != null) {
-                String query = "select PostHistoryId, MostRecentVersion from PostBlockVersion where PostId = " + s +
-                        " group by PostHistoryId, MostRecentVersion order by PostHistoryId desc;";
+            for (String s : postIds) {
+                // Fetch every block of the post in one query, ordered so that the blocks of each
+                // PostHistory arrive together, instead of one extra query per PostHistory.
+                String query = "select PostHistoryId, MostRecentVersion, Id, PostBlockTypeId, LocalId, " +
+                        "PredPostHistoryId, PredPostBlockVersionId, PredLocalId, PredEqual, PredSimilarity " +
+                        "from PostBlockVersion where PostId = " + s + " order by PostHistoryId desc, LocalId;";
                 ResultSet resultSet = statement.executeQuery(query);
                 Post post = new Post(Integer.parseInt(s));
+                PostHistory postHistory = null;
                 while (resultSet.next()) {
                     int postHistoryId = resultSet.getInt("PostHistoryId");
-                    int MostRecentVersion = resultSet.getInt("MostRecentVersion");
-                    PostHistory postHistory = new PostHistory(postHistoryId);
-                    if (MostRecentVersion == 1) {
-                        postHistory.setIsMostRecent(true);
-                    } else {
-                        postHistory.setIsMostRecent(false);
-                    }
-                    if (post.getPostHistoriesSize() > 0) {
-                        post.getPostHistories().getLast().setPreviousPostHistoryId(postHistoryId);
+                    if (postHistory == null || postHistory.getPostHistoryId() != postHistoryId) {
+                        int MostRecentVersion = resultSet.getInt("MostRecentVersion");
+                        postHistory = new PostHistory(postHistoryId);
+                        if (MostRecentVersion == 1) {
+                            postHistory.setIsMostRecent(true);
+                        } else {
+                            postHistory.setIsMostRecent(false);
+                        }
+                        if (post.getPostHistoriesSize() > 0) {
+                            post.getPostHistories().getLast().setPreviousPostHistoryId(postHistoryId);
+                        }
+                        post.addPostHistory(postHistory);
                     }
 
-                    String query2 = "select Id, PostBlockTypeId, LocalId, PredPostHistoryId, PredPostBlockVersionId, " +
-                            "PredLocalId, PredEqual, PredSimilarity from PostBlockVersion where PostHistoryId = "
-                            + postHistoryId + " order by LocalId;";
-                    ResultSet resultSet2 = statement2.executeQuery(query2);
-                    while (resultSet2.next()) {
-                        int postBlockId = resultSet2.getInt("Id");
-                        int postBlockTypeId = resultSet2.getInt("PostBlockTypeId");
-                        int localId = resultSet2.getInt("LocalId");
-                        int precedingPostHistoryId = resultSet2.getInt("PredPostHistoryId");
-                        int precedingPostBlockId = resultSet2.getInt("PredPostBlockVersionId");
-                        int precedingLocalId = resultSet2.getInt("PredLocalId");
-                        int predEqual = resultSet2.getInt("PredEqual");
-                        double precedingSimilarity = resultSet2.getDouble("PredSimilarity");
+                    int postBlockId = resultSet.getInt("Id");
+                    int postBlockTypeId = resultSet.getInt("PostBlockTypeId");
+                    int localId = resultSet.getInt("LocalId");
+                    int precedingPostHistoryId = resultSet.getInt("PredPostHistoryId");
+                    int precedingPostBlockId = resultSet.getInt("PredPostBlockVersionId");
+                    int precedingLocalId = resultSet.getInt("PredLocalId");
+                    int predEqual = resultSet.getInt("PredEqual");
+                    double precedingSimilarity = resultSet.getDouble("PredSimilarity");
 
-                        boolean isCodeBlock;
-                        if (postBlockTypeId == 2) isCodeBlock = true;
-                        else isCodeBlock = false;
-                        boolean isEqualToPrecedingBlock;
-                        if (predEqual == 1) isEqualToPrecedingBlock = true;
-                        else isEqualToPrecedingBlock = false;
+                    boolean isCodeBlock;
+                    if (postBlockTypeId == 2) isCodeBlock = true;
+                    else isCodeBlock = false;
+                    boolean isEqualToPrecedingBlock;
+                    if (predEqual == 1) isEqualToPrecedingBlock = true;
+                    else isEqualToPrecedingBlock = false;
 
-                        PostBlock postBlock = new PostBlock(postBlockId, isCodeBlock, localId, precedingPostHistoryId,
-                                precedingLocalId, precedingPostBlockId, isEqualToPrecedingBlock, precedingSimilarity);
-                        postHistory.addPostBlock(postBlock);
-                    }
-                    post.addPostHistory(postHistory);
+                    PostBlock postBlock = new PostBlock(postBlockId, isCodeBlock, localId, precedingPostHistoryId,
+                            precedingLocalId, precedingPostBlockId, isEqualToPrecedingBlock, precedingSimilarity);
+                    postHistory.addPostBlock(postBlock);
                 }
                 posts.add(post);
                 count++;
@@ -109,10 +107,7 @@ public class PostBlockProcessor {
 
             // Option 4: Write out Diff files of each post in each postHistory
             //writeDiffFiles(posts, statement3);
-
-            bufferedReader.close();
-            fileReader.close();
-        } catch (SQLException | FileNotFoundException throwables) {
+        } catch (SQLException throwables) {
             throwables.printStackTrace();
         } catch (IOException e) {
             e.printStackTrace();
@@ -149,9 +144,9 @@ public class PostBlockProcessor {
             PostHistory postHistory = post.getPostHistories().getFirst();
             boolean codeChange = false;
             boolean textChange = false;
-            for (int i = 0; i < postHistory.getPostBlocks().size(); i++) {
-                if (checkSimilarity(post, postHistory, postHistory.getPostBlocks().get(i).getPostBlockId()) == false) {
-                    if (postHistory.getPostBlocks().get(i).isCodeBlock()) {
+            for (PostBlock postBlock : postHistory.getPostBlocks()) {
+                if (checkSimilarity(post, postHistory, postBlock.getPostBlockId()) == false) {
+                    if (postBlock.isCodeBlock()) {
                         codeChange = true;
                     } else {
                         textChange = true;
@@ -205,14 +200,19 @@ public class PostBlockProcessor {
             FileWriter fileWriter = new FileWriter(directory + fileName);
             BufferedWriter bufferedWriter = new BufferedWriter(fileWriter);
             bufferedWriter.write("PostId,UniqueId,PostBlockType,Revisions,MinSim,MaxSim,AvgSim,AvgDiffDays\n");
+            // counted per block and reported once at the end instead of printing every block
+            int inRangeBlocks = 0;
+            int writtenBlocks = 0;
             for (Post post : posts) {
                 Set<Integer> doneSet = new HashSet<Integer>();
-                for (int i = 0; i < post.getPostHistoriesSize(); i++) {
-                    PostHistory postHistory = post.getPostHistories().get(i);
+                // creation dates are per post, so query them at most once for all of its blocks
+                ArrayList<Date> creationDates = null;
+                for (PostHistory postHistory : post.getPostHistories()) {
                     int previousPostHistoryId = postHistory.getPreviousPostHistoryId();
-                    for (int y = 0; y < postHistory.getPostBlocks().size(); y++) {
-                        PostBlock postBlock = postHistory.getPostBlocks().get(y);
-                        ArrayList<Double> thisSim = new ArrayList<Double>();
+                    for (PostBlock postBlock : postHistory.getPostBlocks()) {
+                        // a chain visits at most one block per posthistory, so this rarely needs to grow
+                        double[] thisSim = new double[post.getPostHistoriesSize()];
+                        int simCount = 0;
                         int currentPostBlockId = 0;
                         int currentPostHistoryId = 0;
                         int precedingPostBlockId = postBlock.getPostBlockId();
@@ -220,38 +220,40 @@ public class PostBlockProcessor {
                         do {
                             currentPostBlockId = precedingPostBlockId;
                             currentPostHistoryId = precedingPostHistoryId;
+                            PostBlock currentPostBlock = post.getPostHistory(currentPostHistoryId).
+                                    getPostBlock(currentPostBlockId);
                             if (!doneSet.contains(currentPostBlockId)) {
-                                thisSim.add(post.getPostHistory(currentPostHistoryId).
-                                        getPostBlock(currentPostBlockId).getPrecedingSimilarity());
+                                if (simCount == thisSim.length) {
+                                    thisSim = Arrays.copyOf(thisSim, simCount * 2 + 1);
+                                }
+                                thisSim[simCount++] = currentPostBlock.getPrecedingSimilarity();
                                 doneSet.add(currentPostBlockId);
                             }
-                            precedingPostBlockId = post.getPostHistory(currentPostHistoryId).
-                                    getPostBlock(currentPostBlockId).getPrecedingPostBlockId();
-                            precedingPostHistoryId = post.getPostHistory(currentPostHistoryId).
-                                    getPostBlock(currentPostBlockId).getPrecedingPostHistoryId();
+                            precedingPostBlockId = currentPostBlock.getPrecedingPostBlockId();
+                            precedingPostHistoryId = currentPostBlock.getPrecedingPostHistoryId();
                         } while (precedingPostBlockId != 0);
-                        if (thisSim.size() > 0) {
+                        if (simCount > 0) {
                             double min = 1.0;
                             double max = 0.0;
                             double avg = 0.0;
-                            for (int x = 0; x < thisSim.size() - 1; x++) {
-                                if (thisSim.get(x).doubleValue() < min) min = thisSim.get(x).doubleValue();
-                                if (thisSim.get(x).doubleValue() > max) max = thisSim.get(x).doubleValue();
-                                avg = avg + thisSim.get(x).doubleValue();
+                            for (int x = 0; x < simCount - 1; x++) {
+                                double sim = thisSim[x];
+                                if (sim < min) min = sim;
+                                if (sim > max) max = sim;
+                                avg = avg + sim;
                             }
                             // write the value out only when it is within the selected similarity range
                             if (avg >= minSimilarity && avg <= maxSimilarity) {
-                                System.out.println("The avg. similarity value is in the range: " + avg);
-                                System.out.println("Checking the post modification duration ...");
-
-                                String query = "select creationDate from PostHistory where PostId=" +
-                                        post.getPostId() + ";";
-                                ResultSet resultSet = statement.executeQuery(query);
-                                ArrayList<Date> creationDates = new ArrayList<Date>();
-                                while (resultSet.next()) {
-                                    Date creationDate = resultSet.getDate("creationDate");
-                                    creationDates.add(creationDate);
-                                    System.out.println(creationDate.toString());
+                                inRangeBlocks++;
+                                if (creationDates == null) {
+                                    String query = "select creationDate from PostHistory where PostId=" +
+                                            post.getPostId() + ";";
+                                    ResultSet resultSet = statement.executeQuery(query);
+                                    creationDates = new ArrayList<Date>();
+                                    while (resultSet.next()) {
+                                        Date creationDate = resultSet.getDate("creationDate");
+                                        creationDates.add(creationDate);
+                                    }
                                 }
                                 int count = 0;
                                 long diffSum = 0;
@@ -263,20 +265,20 @@ public class PostBlockProcessor {
                                     }
                                 }
                                 double avgDiffDays = diffSum / (count * 86400000);
-                                System.out.println("The average post modification duration is: " + avgDiffDays + " days");
                                 // write the posts where the average post modification duration is more than the
                                 // specified minimum number of days.
                                 if (avgDiffDays >= minDiffDays) {
+                                    writtenBlocks++;
                                     if (avg != 0.0) {
                                         PostBlockStat postBlockStat;
                                         if (postBlock.isCodeBlock()) {
                                             postBlockStat = new PostBlockStat(post.getPostId(), postBlock.getPostBlockId(),
-                                                    1, thisSim.size() - 1,
-                                                    min, max, (avg / (thisSim.size() - 1)), avgDiffDays);
+                                                    1, simCount - 1,
+                                                    min, max, (avg / (simCount - 1)), avgDiffDays);
                                         } else {
                                             postBlockStat = new PostBlockStat(post.getPostId(), postBlock.getPostBlockId(),
-                                                    0, thisSim.size() - 1,
-                                                    min, max, (avg / (thisSim.size() - 1)), avgDiffDays);
+                                                    0, simCount - 1,
+                                                    min, max, (avg / (simCount - 1)), avgDiffDays);
                                         }
                                         bufferedWriter.write(postBlockStat.toCSV());
                                     } else {
@@ -296,6 +298,8 @@ public class PostBlockProcessor {
                     }
                 }
             }
+            System.out.println("Blocks in the similarity range: " + inRangeBlocks +
+                    ", blocks written after the duration check: " + writtenBlocks);
             System.out.println("The program is done! Check the file at: " + directory + fileName);
             bufferedWriter.close();
             fileWriter.close();
@@ -316,11 +320,9 @@ public class PostBlockProcessor {
             for (Post post : posts) {
                 Set<Integer> doneSet = new HashSet<Integer>();
                 int runningBlockNumber = 1;
-                for (int i = 0; i < post.getPostHistoriesSize(); i++) {
-                    PostHistory postHistory = post.getPostHistories().get(i);
+                for (PostHistory postHistory : post.getPostHistories()) {
                     int previousPostHistoryId = postHistory.getPreviousPostHistoryId();
-                    for (int y = 0; y < postHistory.getPostBlocks().size(); y++) {
-                        PostBlock postBlock = postHistory.getPostBlocks().get(y);
+                    for (PostBlock postBlock : postHistory.getPostBlocks()) {
                         ArrayList<Double> thisSim = new ArrayList<Double>();
                         int currentPostBlockId = 0;
                         int currentPostHistoryId = 0;
@@ -329,44 +331,40 @@ public class PostBlockProcessor {
                         do {
                             currentPostBlockId = precedingPostBlockId;
                             currentPostHistoryId = precedingPostHistoryId;
+                            PostHistory currentPostHistory = post.getPostHistory(currentPostHistoryId);
+                            PostBlock currentPostBlock = currentPostHistory.getPostBlock(currentPostBlockId);
                             if (!doneSet.contains(currentPostBlockId)) {
-                                String query = "select count(*) as num from PostBlockDiff where PostBlockVersionId = "
-                                        + post.getPostHistory(currentPostHistoryId).
-                                        getPostBlock(currentPostBlockId).getPostBlockId() + ";";
+                                // a single query both tells whether the block has a diff and fetches it
+                                String query = "select Text, PostBlockDiffOperationId from PostBlockDiff " +
+                                        "where PostBlockVersionId = " + currentPostBlock.getPostBlockId() + ";";
                                 ResultSet resultSet = statement.executeQuery(query);
-                                resultSet.next();
-                                if (resultSet.getInt("num") > 0) {
+                                StringBuilder theFile = new StringBuilder();
+                                boolean hasDiff = false;
+                                while (resultSet.next()) {
+                                    hasDiff = true;
+                                    String[] stringSet = resultSet.getString("Text").split("\n");
+                                    int operation = resultSet.getInt("PostBlockDiffOperationId");
+                                    for (String s : stringSet) {
+                                        if (operation == 0) theFile.append("   ");
+                                        else if (operation == 1) theFile.append(" - ");
+                                        else if (operation == -1) theFile.append(" + ");
+                                        theFile.append(s + "\n");
+                                    }
+                                }
+                                if (hasDiff) {
                                     int isCodeBlock = 0;
-                                    if (post.getPostHistory(currentPostHistoryId).
-                                            getPostBlock(currentPostBlockId).isCodeBlock()) {
+                                    if (currentPostBlock.isCodeBlock()) {
                                         isCodeBlock = 1;
                                     }
                                     File file = new File(directory + post.getPostId() + "/" +
-                                            post.getPostId() + "-" + post.getPostHistory(currentPostHistoryId).
-                                            getPostHistoryId() + "-" + post.getPostHistory(currentPostHistoryId).
-                                            getPostBlock(currentPostBlockId).getLocalId() + "-" +
-                                            post.getPostHistory(currentPostHistoryId).getPostBlock(currentPostBlockId).
-                                                    getPostBlockId() + "-" + post.getPostHistory(currentPostHistoryId).
-                                            getPostBlock(currentPostBlockId).getPrecedingPostBlockId() + "-" +
+                                            post.getPostId() + "-" + currentPostHistory.getPostHistoryId() + "-" +
+                                            currentPostBlock.getLocalId() + "-" +
+                                            currentPostBlock.getPostBlockId() + "-" +
+                                            currentPostBlock.getPrecedingPostBlockId() + "-" +
                                             isCodeBlock + ".txt");
                                     file.getParentFile().mkdirs();
                                     FileWriter fileWriter = new FileWriter(file);
                                     BufferedWriter bufferedWriter = new BufferedWriter(fileWriter);
-                                    StringBuilder theFile = new StringBuilder();
-                                    query = "select * from PostBlockDiff where PostBlockVersionId = " +
-                                            post.getPostHistory(currentPostHistoryId).getPostBlock(currentPostBlockId).
-                                                    getPostBlockId() + ";";
-                                    resultSet = statement.executeQuery(query);
-                                    while (resultSet.next()) {
-                                        String[] stringSet = resultSet.getString("Text").split("\n");
-                                        int operation = resultSet.getInt("PostBlockDiffOperationId");
-                                        for (String s : stringSet) {
-                                            if (operation == 0) theFile.append("   ");
-                                            else if (operation == 1) theFile.append(" - ");
-                                            else if (operation == -1) theFile.append(" + ");
-                                            theFile.append(s + "\n");
-                                        }
-                                    }
                                     bufferedWriter.write(theFile.toString());
                                     bufferedWriter.close();
                                     fileWriter.close();
@@ -374,10 +372,8 @@ public class PostBlockProcessor {
                                 }
                                 doneSet.add(currentPostBlockId);
                             }
-                            precedingPostBlockId = post.getPostHistory(currentPostHistoryId).
-                                    getPostBlock(currentPostBlockId).getPrecedingPostBlockId();
-                            precedingPostHistoryId = post.getPostHistory(currentPostHistoryId).
-                                    getPostBlock(currentPostBlockId).getPrecedingPostHistoryId();
+                            precedingPostBlockId = currentPostBlock.getPrecedingPostBlockId();
+                            precedingPostHistoryId = currentPostBlock.getPrecedingPostHistoryId();
                         } while (precedingPostBlockId != 0);
                     }
                 }
@@ -1,24 +1,22 @@
 import java.util.*;
 public class PostHistory {
-    private int postHistoryId;
+    private final int postHistoryId;
     private int previousPostHistoryId;
     private boolean isMostRecent;
     private LinkedList<PostBlock> postBlocks;
+    private HashMap<Integer, PostBlock> postBlockIndex;
 
 
     public PostHistory (int postHistoryId) {
         this.postHistoryId = postHistoryId;
         postBlocks = new LinkedList<PostBlock>();
+        postBlockIndex = new HashMap<Integer, PostBlock>();
     }
 
     public int getPostHistoryId() {
         return postHistoryId;
     }
 
-    public void setPostHistoryId(int postHistoryId) {
-        this.postHistoryId = postHistoryId;
-    }
-
     public int getPreviousPostHistoryId() {
         return previousPostHistoryId;
     }
@@ -41,16 +39,11 @@ public class PostHistory {
 
     public void addPostBlock(PostBlock postBlock) {
         postBlocks.add(postBlock);
+        postBlockIndex.putIfAbsent(postBlock.getPostBlockId(), postBlock);
     }
 
     public PostBlock getPostBlock (int postBlockId) {
-        for (int i = 0; i < postBlocks.size(); i++) {
-            if(postBlocks.get(i).getPostBlockId() == postBlockId) {
-                // System.out.println("Found the postblock!");
-                return postBlocks.get(i);
-            }
-        }
-        // System.out.println("Will return null - from PostHistory");
-        return null;
+        // returns null when the posthistory has no such postblock
+        return postBlockIndex.get(postBlockId);
     }
 }
@@ -4,15 +4,16 @@ import java.nio.file.Path;
 import java.nio.file.Paths;
 import java.sql.*;
 import java.util.ArrayList;
+import java.util.List;
 
 public class PostProcessor {
     public static void main(String[] args) {
         try{
             System.out.println("The program has been initiated.");
-            FileReader fileReader = new FileReader("/home/Dreamteam/acceptedWithVersionAnswer.txt");
-            BufferedReader bufferedReader = new BufferedReader(fileReader);
+            // read the answer ids once and take the query count from them
             Path path = Paths.get("/home/Dreamteam/acceptedWithVersionAnswer.txt");
-            long countLine = Files.lines(path).count();
+            List<String> postIds = Files.readAllLines(path);
+            long countLine = postIds.size();
             String dbUrl = "jdbc:mysql://localhost:3306/sotorrent?autoReconnect=true&useSSL=false";
             String username = "root";
             String password = "1234";
@@ -20,9 +21,8 @@ public class PostProcessor {
             Statement statement =connection.createStatement();
             System.out.println("Connected to the database successfully!\nBeginning querying process...\nThe number of queries initiated: "+countLine);
             long count = 0;
-            String s;
             ArrayList<Post> posts = new ArrayList<Post>();
-            while((s = bufferedReader.readLine()) != null){    
+            for(String s : postIds){
                 String query = "select PostHistoryId, MostRecentVersion from PostBlockVersion where PostId = "+s+" group by PostHistoryId, MostRecentVersion order by PostHistoryId desc;";
                 // String query = "select PostHistoryId, MostRecentVersion from PostBlockVersion where PostId = 43807 group by PostHistoryId, MostRecentVersion order by PostHistoryId desc;";
                 ResultSet resultSet = statement.executeQuery(query);
@@ -62,10 +62,8 @@ public class PostProcessor {
              bufferedWriter.close();
              fileWriter.close();
             System.out.println("The program is done! Check the file at: "+directory+fileName);
-            bufferedReader.close();
-            fileReader.close();
         }
-        catch (SQLException | FileNotFoundException throwables) {
+        catch (SQLException throwables) {
             throwables.printStackTrace();
         } catch (IOException e) {
             e.printStackTrace();